@@ -0,0 +1,160 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Ticker objects for the 5 currency pairs -> file prefix used in the data store
+TICKERS = {
+    "eurusd": "EURUSD=X", #Euro-US Dollar
+    "usdjpy": "USDJPY=X", #US Dollar-Japanese Yen
+    "gbpusd": "GBPUSD=X", #British Pound-US Dollar
+    "usdinr": "USDINR=X", #US Dollar-Indian Rupee
+    "usdzar": "USDZAR=X", #US Dollar-South African Rand
+}
+
+# Time Periods (total length of historical data) -> Intervals (frequency of the data points within the time period)
+# 15m only works with shorter time periods -> stored with an "m" suffix (e.g. eurusd_5dm)
+HORIZONS = [
+    ("1y", "1d", ""),
+    ("6mo", "1d", ""),
+    ("5d", "15m", "m"),
+]
+
+REQUIRED_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+# Every (pair, ticker, interval, period, filename) combination to download
+def ingestion_jobs():
+    return [
+        (pair, ticker, interval, period, pair+"_"+period+suffix)
+        for period, interval, suffix in HORIZONS
+        for pair, ticker in TICKERS.items()
+    ]
+
+# Source adapters -> any object with a blocking fetch(ticker, interval, period) returning a DataFrame can be used
+# (fetch is run in the ingestion thread pool, so at most `concurrency` downloads are ever running)
+
+# Downloads historical FX data from Yahoo Finance (timeout -> per-request limit so a hung download frees its thread)
+class YahooSource:
+    def __init__(self, timeout=30):
+        self.timeout = timeout
+
+    def fetch(self, ticker, interval, period):
+        import yfinance as yf
+
+        return yf.Ticker(ticker).history(interval=interval, period=period, timeout=self.timeout)
+
+# Reads previously saved CSVs named <ticker>_<interval>_<period>.csv -> from a local directory (FixtureSource)
+# or from a URL (HTTPSource, e.g. the same directory served with "python -m http.server") so the pipeline runs without Yahoo
+class FixtureSource:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def location(self, ticker, interval, period):
+        return os.path.join(self.directory, ticker+"_"+interval+"_"+period+".csv")
+
+    def fetch(self, ticker, interval, period):
+        import pandas as pd
+
+        return pd.read_csv(self.location(ticker, interval, period))
+
+class HTTPSource(FixtureSource):
+    def location(self, ticker, interval, period):
+        return self.directory.rstrip("/")+"/"+ticker+"_"+interval+"_"+period+".csv"
+
+# Validating the downloaded frame before it is written to the data store
+def validate(data, ticker, interval, period):
+    if data is None or len(data) == 0:
+        raise ValueError("No data returned for "+ticker+" ("+interval+", "+period+")")
+
+    # Intraday data is indexed by "Datetime" instead of "Date" -> rename so every file has the same layout
+    if data.index.name is not None:
+        data = data.reset_index()
+    data = data.rename(columns={"Datetime": "Date"})
+    data = data[[c for c in data.columns if not str(c).startswith("Unnamed:")]] # Index column saved by older CSVs -> not part of the data
+
+    missing = [c for c in REQUIRED_COLUMNS if c not in data.columns]
+    if missing:
+        raise ValueError("Missing columns "+", ".join(missing)+" for "+ticker+" ("+interval+", "+period+")")
+
+    data = data.dropna(subset=["Close"]) # FX trades don't occur on weekends/holidays -> remove these datapoints to avoid confusion/false signals
+    if len(data) == 0:
+        raise ValueError("Only empty rows returned for "+ticker+" ("+interval+", "+period+")")
+    return data
+
+# Writing to a temporary file first and then renaming it -> readers never see a half-written CSV
+def atomic_write(data, path):
+    tmp_path = path+".tmp"
+    data.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+# Errors worth retrying -> timeouts, dropped connections & rate limit (429) / server-side (5xx) HTTP errors
+# A missing fixture file or a 404 won't fix itself on a retry
+def is_transient(error):
+    from urllib.error import HTTPError
+
+    if isinstance(error, HTTPError):
+        return error.code == 429 or error.code >= 500
+    if isinstance(error, (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError)):
+        return False
+    return isinstance(error, (TimeoutError, ConnectionError, OSError)) # OSError also covers URL/requests network errors
+
+# Only transient errors & empty frames are retried -> a frame with missing columns won't change on retry, so validate() errors are raised straight away
+async def fetch_with_retry(source, ticker, interval, period, semaphore, executor, retries, backoff, timeout):
+    loop = asyncio.get_running_loop()
+    for attempt in range(retries + 1):
+        # A concurrency slot is held per attempt & only released once the download thread has actually finished
+        # (a timed out download keeps running in its thread -> it still counts against the limit, but backing off doesn't)
+        await semaphore.acquire()
+        future = loop.run_in_executor(executor, source.fetch, ticker, interval, period)
+        future.add_done_callback(lambda _: semaphore.release())
+        try:
+            data = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            error = e
+        else:
+            if data is not None and len(data) > 0:
+                break
+            error = ValueError("No data returned for "+ticker+" ("+interval+", "+period+")") # Yahoo returns an empty frame when throttled
+            if attempt == retries:
+                raise error
+        delay = backoff * 2 ** attempt # Exponential backoff -> 1s, 2s, 4s, ...
+        print("Retrying", ticker, interval, period, "in", delay, "s after error:", repr(error))
+        await asyncio.sleep(delay)
+    return validate(data, ticker, interval, period)
+
+async def ingest_all(source=None, data_dir=None, concurrency=4, retries=3, backoff=1.0, timeout=30):
+    if source is None:
+        source = YahooSource(timeout)
+    if data_dir is None:
+        from main import DATA_DIR
+        data_dir = DATA_DIR
+    os.makedirs(data_dir, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency) # Bounded concurrency -> avoids being rate limited by the data provider
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def ingest_one(pair, ticker, interval, period, filename):
+        data = await fetch_with_retry(source, ticker, interval, period, semaphore, executor, retries, backoff, timeout)
+        path = os.path.join(data_dir, filename)
+        await asyncio.to_thread(atomic_write, data, path)
+        return path
+
+    jobs = ingestion_jobs()
+    try:
+        results = await asyncio.gather(*(ingest_one(*job) for job in jobs), return_exceptions=True)
+    finally:
+        executor.shutdown(wait=False) # Abandoned (timed out) downloads are left to finish in the background
+
+    # Reporting failures after every other job has finished -> one bad ticker doesn't stop the rest from being saved
+    failures = [(job[4], r) for job, r in zip(jobs, results) if isinstance(r, Exception)]
+    for filename, error in failures:
+        print("Failed to ingest", filename, "->", repr(error))
+    if failures:
+        raise RuntimeError(str(len(failures))+" of "+str(len(jobs))+" downloads failed")
+    return results
+
+def main(source=None, data_dir=None, **kwargs):
+    return asyncio.run(ingest_all(source, data_dir, **kwargs))
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,12 @@
-import sys
 import os
-sys.path.append(os.path.abspath("C:/Users/alvin/Downloads/FX_Backtester")) # To be able to access all .py files in the main directory
 
-from backtesting import Backtest # To run the backtest
-from strategies.sma_crossover import optimize_sma_strategy
-from strategies.ema_crossover import optimize_ema_strategy
-from strategies.momentum import optimize_mm_strategy
-from strategies.mean_reversion import optimize_mr_strategy
-from strategies.momentum import combined_optimal_strategy
-from strategies.momentum import combined_optimal_strategy1
-import pandas as pd
+# Root directories (default to the folder containing this file) -> can be overridden with environment variables or per call in run()
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.environ.get("FX_DATA_DIR", BASE_DIR)  # Where the fetched CSV price data is stored
+OUTPUT_DIR = os.environ.get("FX_OUTPUT_DIR", BASE_DIR)  # Where the HTML backtest plots are written (one sub-folder per strategy)
+METRICS_DIR = os.environ.get("FX_METRICS_DIR", BASE_DIR)  # Where the <strategy>_metrics.csv files are appended to
+
+TIMEFRAMES = ["1y", "6mo", "5d"]
 
 # Data Menu _. Allow users to select currency pair
 def data_menu():
@@ -43,9 +40,17 @@ def time_menu():
         interval = "m"
     return time,interval
 
+# Intraday (5 day) data is stored with an "m" suffix (e.g. eurusd_5dm)
+def timeframe_interval(time):
+    if time not in TIMEFRAMES:
+        raise ValueError("Unknown timeframe: " + str(time) + " (expected one of " + ", ".join(TIMEFRAMES) + ")")
+    return "m" if time == "5d" else ""
+
 # Dataframe Extraction
-def df_extraction(pair,time,interval):
-    df = pd.read_csv("C:/Users/alvin/Downloads/FX_Backtester/data/"+pair+"_"+time+interval) # Importing data
+def df_extraction(pair,time,interval,data_dir=None):
+    import pandas as pd  # Imported lazily -> keeps start-up fast when only the menu/registry is needed
+
+    df = pd.read_csv(os.path.join(data_dir or DATA_DIR, pair+"_"+time+interval)) # Importing data
     
     # Ensure full UTC(Coordinated Universal Time) parsing and timezone awareness
     df['Date'] = pd.to_datetime(df['Date'], utc=True)
@@ -57,23 +62,48 @@ def df_extraction(pair,time,interval):
     df = df[['Open', 'High', 'Low', 'Close', 'Volume']] # Can drop Volume as it is =0 for FX trades
     return df
 
-def output_tracker(pair,time,interval,df,optimize_strategy,strategy_no):
-    if os.path.exists("C:/Users/alvin/Downloads/FX_Backtester/outputs/"+str(strategy_no)+"/"+pair+"_"+time+interval+"_results.html"):
+def output_tracker(pair,time,interval,df,strategy_no,params=None,output_dir=None,metrics_dir=None):
+    from backtesting import Backtest # To run the backtest
+    from strategies import get_optimizer, get_strategy
+
+    output_path = os.path.join(output_dir or OUTPUT_DIR, str(strategy_no), pair+"_"+time+interval+"_results.html")
+    metrics_path = os.path.join(metrics_dir or METRICS_DIR, str(strategy_no)+"_metrics.csv")
+    if os.path.exists(output_path):
         print("Outputs already exist")
-        print("C:/Users/alvin/Downloads/FX_Backtester/outputs/"+str(strategy_no)+"/"+pair+"_"+time+interval+"_results.html")
-        print("C:/Users/alvin/Downloads/FX_Backtester/metrics/"+str(strategy_no)+"_metrics.csv")
+        print(output_path)
+        print(metrics_path)
+        return None
+    
+    if params is None:
+        strategy_class, params, net_ret = get_optimizer(strategy_no)(df,time) # Optimizing function from the selected strategy module
     else:
-        strategy_class, best_params, net_ret = optimize_strategy(df,time) # Optimizing function from sma_crossover
-        
-        # cash -> initial capital in the portfolio
-        # Brokers charge comissions in the form of per-trade comission (usually flat) or spreads.
-        # commission -> transaction cost per trade (expressed as a proportion of trade value) -> generally 0.1%-0.2% 
-        # spreads (not included by default) -> the difference between ask(buy) & bid(sell) price (i.e. Ask-Bid) -> e.g. spread = 0.0002 = 2 pips
-        bt = Backtest(df,strategy_class,cash=10000,commission=0.0002, trade_on_close=True) 
-        results = bt.run()
-        print(results) # gives raw backtest data
-        results.to_frame().T.to_csv("C:/Users/alvin/Downloads/FX_Backtester/metrics/"+str(strategy_no)+"_metrics.csv",mode="a",index=False)
-        bt.plot(filename="C:/Users/alvin/Downloads/FX_Backtester/outputs/"+str(strategy_no)+"/"+pair+"_"+time+interval+"_results.html", open_browser=False)
+        strategy_class = get_strategy(strategy_no) # Known parameters -> skip optimization entirely
+    print("Using parameters ->", params)
+    
+    # cash -> initial capital in the portfolio
+    # Brokers charge comissions in the form of per-trade comission (usually flat) or spreads.
+    # commission -> transaction cost per trade (expressed as a proportion of trade value) -> generally 0.1%-0.2% 
+    # spreads (not included by default) -> the difference between ask(buy) & bid(sell) price (i.e. Ask-Bid) -> e.g. spread = 0.0002 = 2 pips
+    bt = Backtest(df,strategy_class,cash=10000,commission=0.0002, trade_on_close=True) 
+    results = bt.run(**dict(params, timeframe=time))
+    print(results) # gives raw backtest data
+    os.makedirs(os.path.dirname(metrics_path), exist_ok=True)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    bt.plot(filename=output_path, open_browser=False)
+
+    # Full metrics row (same layout as the existing <strategy>_metrics.csv files) & summary row for the comparison dashboard (report.py)
+    from report import append_metrics, record_run
+    append_metrics(results, pair, time, metrics_path)
+    record_run(results, strategy_no, pair, time, params, metrics_dir)
+    return results
+
+# Programmatic entry point -> runs one strategy on one currency pair & timeframe without going through the menus
+# params=None optimizes the strategy first, otherwise the given parameters are used directly
+# e.g. run("eurusd", "1y", "sma1") or run("eurusd", "1y", "sma1", params={"fast": 12, "slow": 38})
+def run(pair, timeframe, strategy, params=None, data_dir=None, output_dir=None, metrics_dir=None):
+    interval = timeframe_interval(timeframe)
+    df = df_extraction(pair, timeframe, interval, data_dir)
+    return output_tracker(pair, timeframe, interval, df, strategy, params, output_dir, metrics_dir)
     
 # Main Menu
 def main_menu():
@@ -99,18 +129,14 @@ def main_menu():
             if user5 == 1:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,optimize_sma_strategy,strategy_no="sma1")
+                run(pair, time, "sma1")
                 
             elif user5 == 2:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,combined_optimal_strategy,strategy_no="sma2")
+                run(pair, time, "sma2")
                 
             elif user5 == 3:
                 continue
@@ -128,18 +154,14 @@ def main_menu():
             if user6 == 1:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,optimize_mm_strategy,strategy_no="mm1")
+                run(pair, time, "mm1")
                 
             elif user6 == 2:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,combined_optimal_strategy,strategy_no="mm2")
+                run(pair, time, "mm2")
                 
             elif user6 == 3:
                 continue
@@ -156,10 +178,8 @@ def main_menu():
             if user7 == 1:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,optimize_mr_strategy,strategy_no="mr1")
+                run(pair, time, "mr1")
                 
             elif user7 == 2:
                 continue
@@ -177,18 +197,14 @@ def main_menu():
             if user8 == 1:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,optimize_ema_strategy,strategy_no="ema1")
+                run(pair, time, "ema1")
                 
             elif user8 == 2:
                 pair = data_menu()
                 time, interval = time_menu()
-                df = df_extraction(pair, time, interval)
-                
                 # Running backtest
-                output_tracker(pair,time,interval,df,combined_optimal_strategy1,strategy_no="ema2")
+                run(pair, time, "ema2")
                 
             elif user8 == 3:
                 continue
@@ -197,4 +213,5 @@ def main_menu():
         else:
             break
             
-main_menu()
+if __name__ == "__main__":
+    main_menu()
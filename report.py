@@ -0,0 +1,188 @@
+import html
+import json
+import os
+
+# One row per backtest run -> strategies/pairs/timeframes are compared from this file alone (no need to re-load trade data)
+SUMMARY_FILE = "runs_summary.csv"
+SUMMARY_COLUMNS = ["run_at", "strategy", "pair", "timeframe", "params", "return_pct", "sharpe", "max_drawdown_pct", "trades", "equity"]
+SPARKLINE_POINTS = 40 # Equity curve is down-sampled to this many points before being stored
+
+def summary_path(metrics_dir=None):
+    if metrics_dir is None:
+        from main import METRICS_DIR
+        metrics_dir = METRICS_DIR
+    return os.path.join(metrics_dir, SUMMARY_FILE)
+
+def append_rows(rows, path):
+    import pandas as pd
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pd.DataFrame(rows, columns=SUMMARY_COLUMNS).to_csv(path, mode="a", index=False, header=not os.path.exists(path))
+
+# Called after every backtest -> stores the headline metrics & a down-sampled equity curve of the run
+def record_run(results, strategy_no, pair, time, params, metrics_dir=None):
+    import numpy as np
+    import pandas as pd
+
+    equity = results["_equity_curve"]["Equity"].to_numpy()
+    idx = np.linspace(0, len(equity) - 1, min(SPARKLINE_POINTS, len(equity))).astype(int)
+    append_rows([{
+        "run_at": pd.Timestamp.now(tz="UTC").isoformat(),
+        "strategy": strategy_no,
+        "pair": pair,
+        "timeframe": time,
+        "params": json.dumps(params, default=str),
+        "return_pct": results["Return [%]"],
+        "sharpe": results["Sharpe Ratio"],
+        "max_drawdown_pct": results["Max. Drawdown [%]"],
+        "trades": results["# Trades"],
+        "equity": " ".join(str(round(float(v), 2)) for v in equity[idx]),
+    }], summary_path(metrics_dir))
+
+# Appends the full backtest metrics to <strategy>_metrics.csv in the same layout as the existing files
+# (labelled "Pair-timeperiod" column first, no _strategy/_equity_curve objects) -> columns are aligned to the file's header if it exists
+def append_metrics(results, pair, time, path):
+    import pandas as pd
+
+    row = results.drop(["_strategy", "_equity_curve"], errors="ignore").to_frame().T
+    row.insert(0, "Pair-timeperiod", pair[:3].upper()+"/"+pair[3:].upper()+"-"+time)
+    has_header = os.path.exists(path) and os.path.getsize(path) > 0
+    if has_header:
+        row = row.reindex(columns=pd.read_csv(path, nrows=0).columns)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    row.to_csv(path, mode="a", index=False, header=not has_header)
+
+LEGACY_COLUMNS = ["Pair-timeperiod", "End", "Return [%]", "Sharpe Ratio", "Max. Drawdown [%]", "# Trades"]
+
+# Import of the <strategy>_metrics.csv files (rows labelled e.g. "USD/EUR-1y") -> no equity curve available for these
+# run_at is left empty (the file only records when the data ends, not when the run happened) -> backfilled rows rank as oldest, in file order
+# Only files with the labelled layout are read & rows that can't be parsed are skipped
+# Rows already in the summary (same strategy, pair, timeframe & return) are skipped -> safe to run more than once
+def backfill_legacy_metrics(metrics_dir=None):
+    import glob
+    import pandas as pd
+    from ingest import TICKERS
+    from main import TIMEFRAMES
+
+    path = summary_path(metrics_dir)
+    pairs = {frozenset([p[:3], p[3:]]): p for p in TICKERS}
+    existing = set()
+    if os.path.exists(path):
+        done = pd.read_csv(path, usecols=["strategy", "pair", "timeframe", "return_pct"])
+        existing = {(r[0], r[1], r[2], round(r[3], 6)) for r in done.itertuples(index=False)}
+
+    rows = []
+    for file in sorted(glob.glob(os.path.join(os.path.dirname(path), "*_metrics.csv"))):
+        if os.path.getsize(file) == 0 or not set(LEGACY_COLUMNS).issubset(pd.read_csv(file, nrows=0).columns):
+            continue
+        strategy_no = os.path.basename(file)[:-len("_metrics.csv")]
+        df = pd.read_csv(file, usecols=LEGACY_COLUMNS, dtype={"Pair-timeperiod": str})
+        df["End"] = pd.to_datetime(df["End"], utc=True, format="ISO8601", errors="coerce")
+        for c in LEGACY_COLUMNS[2:]:
+            df[c] = pd.to_numeric(df[c], errors="coerce")
+
+        for label, end, ret, sharpe, drawdown, trades in df.itertuples(index=False):
+            if not isinstance(label, str) or "-" not in label or pd.isna(end) or pd.isna(ret): # A valid End date marks a well-formed legacy row
+                continue
+            label, time = label.rsplit("-", 1)
+            pair = pairs.get(frozenset(label.lower().split("/")))
+            if pair is None or time not in TIMEFRAMES:
+                continue
+            key = (strategy_no, pair, time, round(ret, 6))
+            if key in existing:
+                continue
+            existing.add(key)
+            rows.append({
+                "run_at": "",
+                "strategy": strategy_no,
+                "pair": pair,
+                "timeframe": time,
+                "params": "",
+                "return_pct": ret,
+                "sharpe": sharpe,
+                "max_drawdown_pct": drawdown,
+                "trades": trades,
+                "equity": "",
+            })
+    if rows:
+        append_rows(rows, path)
+    return len(rows)
+
+# Inline SVG sparkline of a stored equity curve
+def sparkline(equity, width=120, height=30):
+    if not isinstance(equity, str) or not equity:
+        return ""
+    values = [float(v) for v in equity.split()]
+    low, high = min(values), max(values)
+    span = (high - low) or 1
+    step = width / max(len(values) - 1, 1)
+    points = " ".join(str(round(i * step, 1))+","+str(round(height - (v - low) / span * height, 1)) for i, v in enumerate(values))
+    colour = "#2a9d3f" if values[-1] >= values[0] else "#c0392b"
+    return '<svg width="'+str(width)+'" height="'+str(height)+'"><polyline fill="none" stroke="'+colour+'" stroke-width="1.5" points="'+points+'"/></svg>'
+
+# Reading every stored run in one go & keeping the most recent run (by run_at) of each strategy x pair x timeframe
+def load_latest_runs(metrics_dir=None):
+    import pandas as pd
+
+    runs = pd.read_csv(summary_path(metrics_dir), usecols=SUMMARY_COLUMNS, dtype={"params": str, "equity": str})
+    runs["run_at"] = pd.to_datetime(runs["run_at"], utc=True, format="ISO8601", errors="coerce")
+    runs["trades"] = pd.to_numeric(runs["trades"], errors="coerce").round().astype("Int64") # Stays an integer column even when some counts are missing
+    runs = runs.sort_values("run_at", kind="stable", na_position="first") # Latest run by time, not by position in the file (backfilled rows have no run_at)
+    latest = runs.drop_duplicates(subset=["strategy", "pair", "timeframe"], keep="last")
+    latest = latest.sort_values("return_pct", ascending=False).reset_index(drop=True)
+    latest["return_rank"] = latest["return_pct"].rank(ascending=False, method="min").astype(int)
+    latest["sharpe_rank"] = latest["sharpe"].rank(ascending=False, method="min", na_option="bottom").astype(int)
+    latest["drawdown_rank"] = latest["max_drawdown_pct"].rank(ascending=False, method="min", na_option="bottom").astype(int) # Drawdowns are negative -> closest to 0 ranks first
+    return runs, latest
+
+def build_dashboard(metrics_dir=None, output_dir=None):
+    # No new-style runs recorded yet -> start from the existing <strategy>_metrics.csv files
+    if not os.path.exists(summary_path(metrics_dir)):
+        backfill_legacy_metrics(metrics_dir)
+    if not os.path.exists(summary_path(metrics_dir)):
+        print("No runs recorded yet in", os.path.dirname(summary_path(metrics_dir)))
+        return None
+
+    runs, latest = load_latest_runs(metrics_dir)
+    if output_dir is None:
+        from main import OUTPUT_DIR
+        output_dir = OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
+
+    # JSON dashboard -> same ranking for other tools to consume
+    json_path = os.path.join(output_dir, "dashboard.json")
+    with open(json_path, "w") as f:
+        f.write(latest.to_json(orient="records", indent=1, date_format="iso"))
+
+    # Static HTML dashboard -> one table ranked by return, with Sharpe/drawdown ranks & an equity sparkline per row
+    columns = ["return_rank", "strategy", "pair", "timeframe", "return_pct", "sharpe", "sharpe_rank", "max_drawdown_pct", "drawdown_rank", "trades", "params"]
+    header = "".join("<th>"+c+"</th>" for c in columns) + "<th>equity</th>"
+    body = []
+    for row in latest.to_dict(orient="records"):
+        cells = "".join("<td>"+html.escape(format_cell(row[c]))+"</td>" for c in columns)
+        body.append("<tr>"+cells+"<td>"+sparkline(row["equity"])+"</td></tr>")
+    page = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>FX Strategy Dashboard</title>"
+        "<style>body{font-family:sans-serif}table{border-collapse:collapse}th,td{padding:2px 8px;border-bottom:1px solid #ddd;text-align:right}</style>"
+        "</head><body><h1>FX Strategy Dashboard</h1>"
+        "<p>"+str(len(latest))+" strategy x pair x timeframe combinations from "+str(len(runs))+" stored runs</p>"
+        "<table><tr>"+header+"</tr>"+"".join(body)+"</table></body></html>"
+    )
+    html_path = os.path.join(output_dir, "dashboard.html")
+    with open(html_path, "w") as f:
+        f.write(page)
+    return html_path, json_path
+
+def format_cell(value):
+    import pandas as pd
+
+    if value is None or value is pd.NA or value is pd.NaT:
+        return ""
+    if isinstance(value, float):
+        return "" if value != value else str(round(value, 2)) # value != value -> NaN
+    return str(value)
+
+if __name__ == "__main__":
+    paths = build_dashboard()
+    if paths:
+        print(paths)
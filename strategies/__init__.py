@@ -0,0 +1,32 @@
+# Strategy registry -> maps each strategy number to its module, parametrized strategy class & optimizer function
+# Modules are only imported when a strategy is requested, so a worker that runs SMA1 never loads joblib/momentum code
+# Strategy classes take their parameters as class attributes -> Backtest.run(**params) runs them with stored parameters (no re-optimization)
+import importlib
+
+STRATEGIES = {
+    "sma1": ("strategies.sma_crossover", "SMACrossover1", "optimize_sma_strategy"),
+    "sma2": ("strategies.momentum", "CombinedStrategy1", "combined_optimal_strategy"),
+    "mm1": ("strategies.momentum", "MMStrategy1", "optimize_mm_strategy"),
+    "mm2": ("strategies.momentum", "CombinedStrategy1", "combined_optimal_strategy"),
+    "mr1": ("strategies.mean_reversion", "MRStrategy1", "optimize_mr_strategy"),
+    "ema1": ("strategies.ema_crossover", "EMACrossover1", "optimize_ema_strategy"),
+    "ema2": ("strategies.momentum", "CombinedStrategy2", "combined_optimal_strategy1"),
+}
+
+def _lookup(strategy_no):
+    try:
+        module_name, class_name, func_name = STRATEGIES[strategy_no]
+    except KeyError:
+        raise ValueError("Unknown strategy: " + str(strategy_no) + " (expected one of " + ", ".join(STRATEGIES) + ")") from None
+    module = importlib.import_module(module_name)  # Lazy import -> only the requested strategy module is loaded
+    return module, class_name, func_name
+
+# Returns the strategy class -> e.g. get_strategy("sma1") with params {"fast": 12, "slow": 38}
+def get_strategy(strategy_no):
+    module, class_name, _ = _lookup(strategy_no)
+    return getattr(module, class_name)
+
+# Returns the optimizer function -> optimizer(df, time) gives (strategy class, best parameters, net return)
+def get_optimizer(strategy_no):
+    module, _, func_name = _lookup(strategy_no)
+    return getattr(module, func_name)
@@ -0,0 +1,56 @@
+from backtesting import Backtest, Strategy
+from backtesting.lib import crossover
+import numpy as np
+
+# This function calculates the EMA indicator values
+def EMA(values, period):
+    ema = np.full(len(values), np.nan) # Creates a numpy array filled with NaN
+    alpha = 2 / (period + 1) 
+    ema[period - 1] = np.mean(values[:period]) # Formula for calculating MA on a rolling basis
+    
+    # initial EMA value = NaN 
+    for i in range(period, len(values)):
+        ema[i] = alpha * values[i] + (1 - alpha) * ema[i - 1] # Standard formula for EMA -> alpha*current_price + (1-alpha)*past_ema
+    return ema
+            
+# EMA1 Strategy -> parametrized by the fast & slow time windows
+class EMACrossover1(Strategy):
+    fast = 12
+    slow = 26
+    timeframe = "1y"
+
+    def init(self):  
+        self.ema_fast = self.I(EMA, self.data.Close, self.fast)  
+        self.ema_slow = self.I(EMA, self.data.Close, self.slow)
+
+    def next(self): 
+        if self.position.is_long and crossover(self.ema_slow, self.ema_fast):
+            self.position.close()
+            self.sell()
+        elif self.position.is_short and crossover(self.ema_fast, self.ema_slow):
+            self.position.close()
+            self.buy()
+        elif not self.position:
+            if crossover(self.ema_fast, self.ema_slow):
+                self.buy()  
+            elif crossover(self.ema_slow, self.ema_fast):
+                self.sell()  
+
+def optimize_ema_strategy(df, time):
+    net_return = -np.inf
+    best_params = None
+
+    cash = 10000
+    bt = Backtest(df, EMACrossover1, cash=cash, commission=0.0002, trade_on_close=True)
+
+    for fast in range(3, 20):
+        for slow in range(fast + 1, 60):
+            stats = bt.run(fast=fast, slow=slow, timeframe=time)
+            current_return = (stats['Equity Final [$]'] - cash) / cash 
+
+            if current_return > net_return:  
+                net_return = current_return
+                best_params = {"fast": fast, "slow": slow}
+
+    # Optimal window EMA1 Strategy -> to be passed into main module together with the parameters to run it with
+    return EMACrossover1, best_params, net_return
@@ -0,0 +1,115 @@
+from backtesting import Backtest, Strategy
+import pandas as pd
+import numpy as np
+from joblib import Parallel, delayed
+
+# Declaring threshold values (scaled according to time period)
+y1_threshold = 2.5  # The Z-score required to trigger a trade
+mo6_threshold = 1.75
+days5_threshold = 1.5
+threshold_list = [y1_threshold, mo6_threshold, days5_threshold]
+
+# Picking the Z-score threshold based on the time period
+def get_threshold(time):
+    if time == "1y":
+        return threshold_list[0]
+    elif time == "6mo":
+        return threshold_list[1]
+    else:
+        return threshold_list[2]
+
+# Calculating indicator values
+def z_scores(values, period):
+    s = pd.Series(values)
+    sma = s.rolling(period).mean() # Find the SMA (treated as the "mean" value here) on a rolling basis
+    std = s.rolling(period).std() # Find standard deviation of close prices on a rolling basis
+    z = (s - sma) / std # Formula to calculate Z-scores
+    return z.to_numpy()
+
+# Volatility scalings tried by the MR1 optimizer (None -> fixed threshold from threshold_list)
+vol_scales = [None, 0.75, 1.0, 1.25]
+
+# Volatility regime (current rolling volatility / its long-run average) -> doesn't depend on the window or scaling,
+# so the optimizer computes it once as a "VolatilityRegime" column
+def volatility_regime(values, vol_window):
+    volatility = pd.Series(values).pct_change().rolling(vol_window).std()
+    return (volatility / volatility.expanding().mean()).to_numpy()
+
+# Calculating the Z-score threshold for every bar in one vectorized pass
+# Z-scores are already normalized by each pair's own standard deviation -> scale by the volatility regime instead
+# so trades need a larger deviation when the market is unusually volatile
+def threshold_series(values, threshold, vol_scale, regime):
+    if vol_scale is None:
+        return np.full(len(values), threshold)
+    return threshold * vol_scale * np.asarray(regime)
+
+# NOTE: Tried sequential -> Too inactive and was constantly making negative returns (only very slightly positive profits which are eaten up by commissions)
+# Stricter threshold helps
+# waiting till price returns to 0 tends to perform better than exiting earlier
+
+# MR1 Strategy -> parametrized by the rolling time window (threshold defaults to the value for the selected time period, vol_scale switches to a volatility-scaled threshold)
+class MRStrategy1(Strategy):
+    window = 10
+    threshold = None
+    vol_scale = None
+    vol_window = 20
+    timeframe = "1y"
+
+    def init(self):
+        if self.threshold is None:
+            self.threshold = get_threshold(self.timeframe)
+        self.z = self.I(z_scores, self.data.Close, self.window)
+        regime = None
+        if self.vol_scale is not None:
+            regime = getattr(self.data, "VolatilityRegime", None) # Precomputed by optimize_mr_strategy
+            if regime is None:
+                regime = volatility_regime(self.data.Close, self.vol_window)
+        self.threshold_indicator = self.I(threshold_series, self.data.Close, self.threshold, self.vol_scale, regime, plot=False)
+
+    def next(self):
+        threshold = self.threshold_indicator[-1]
+        if np.isnan(self.z[-1]) or np.isnan(threshold):  # avoid NaNs
+            return
+
+        # Exit a long trade when price is closer to the mean (i.e. price is returning to the expected average value -> no more gains)
+        if self.position.is_long and self.z[-1] >= 0:
+            self.position.close()
+            self.sell()
+        # Exit a short trade when price is closer to the mean (i.e. price is returning to the expected average value -> no more gains)
+        elif self.position.is_short and self.z[-1] <= 0:
+            self.position.close()
+            self.buy()
+
+        # Entering trades when there are significant deviations from mean value
+        elif not self.position:
+            if self.z[-1] > threshold:
+                self.buy()
+            elif self.z[-1] < -threshold:
+                self.sell()
+
+# Backtesting one (window, vol_scale) candidate of the MR1 grid
+def evaluate_mr_strategy(data, window, vol_scale, time):
+    bt = Backtest(data, MRStrategy1, cash=10000, commission=0.0002)
+    stats = bt.run(window=window, vol_scale=vol_scale, timeframe=time)
+    net_return = (stats["Equity Final [$]"] - 10000) / 10000
+    return window, vol_scale, net_return
+
+# MR1 strategy optimization
+def optimize_mr_strategy(df, time):
+    # Volatility regime is computed once here -> every (window, vol_scale) candidate's threshold is just a scalar multiple of it
+    data = df.assign(VolatilityRegime=volatility_regime(df["Close"].to_numpy(), MRStrategy1.vol_window))
+
+    # MR1 -> Finding the optimal time window & volatility scaling for mean reversion-based Strategy that results in the highest net return
+    # --- Run parallel jobs over the whole grid ---
+    results = Parallel(n_jobs=-1, backend='loky')(
+        delayed(evaluate_mr_strategy)(data, window, vol_scale, time)
+        for window in range(3, 20)
+        for vol_scale in vol_scales
+    )
+
+    # --- Select best parameters ---
+    best_window, best_scale, net_return = max(results, key=lambda x: x[2])
+    best_params = {"window": best_window, "vol_scale": best_scale}
+
+    # Optimal window MRStrategy -> to be passed into main module together with the parameters to run it with
+    return MRStrategy1, best_params, net_return
@@ -0,0 +1,232 @@
+from backtesting import Backtest, Strategy
+import pandas as pd
+import numpy as np
+from joblib import Parallel, delayed
+import itertools
+
+# Declaring threshold values (scaled according to time period)
+y1_threshold = 0.02  # % change w.r.t. recent price required to enter/exit a trade
+mo6_threshold = 0.01
+days5_threshold = 0.002
+threshold_list = [y1_threshold, mo6_threshold, days5_threshold]
+
+# Picking the momentum threshold based on the time period
+def get_threshold(time):
+    if time == "1y":
+        return threshold_list[0]
+    elif time == "6mo":
+        return threshold_list[1]
+    else:
+        return threshold_list[2]
+
+# Calculating SMA indicator values
+def SMA(values, period):
+    weights = np.ones(period) / period  
+    sma = np.convolve(values, weights, mode='valid') 
+    return np.concatenate([np.full(period - 1, np.nan), sma])
+
+# Calculating EMA indicator values
+def EMA(values, period):
+    ema = np.full(len(values), np.nan) # Creates a numpy array filled with NaN
+    alpha = 2 / (period + 1) 
+    ema[period - 1] = np.mean(values[:period]) # Formula for calculating MA on a rolling basis
+    
+    # initial EMA value = NaN 
+    for i in range(period, len(values)):
+        ema[i] = alpha * values[i] + (1 - alpha) * ema[i - 1] # Standard formula for EMA -> alpha*current_price + (1-alpha)*past_ema
+    return ema
+
+# Calculating momentum indicator values
+def momentum(values, period):
+    s = pd.Series(values)
+    momentum_series = (s - s.shift(period)) / s.shift(period)  # .shift() allows us to calculate values across a rolling time window
+    return momentum_series.to_numpy()  # converting to NumPy for self.I() compatibility
+
+# Volatility scalings tried by the MM1 optimizer (None -> fixed threshold from threshold_list)
+vol_scales = [None, 0.5, 0.75, 1.0, 1.5, 2.0]
+
+# Rolling volatility (std of 1-bar % returns) -> doesn't depend on the window or scaling, so the optimizer computes it once as a "Volatility" column
+def rolling_volatility(values, vol_window):
+    return pd.Series(values).pct_change().rolling(vol_window).std().to_numpy()
+
+# Calculating the threshold for every bar in one vectorized pass
+# vol_scale=None -> constant threshold, otherwise vol_scale * expected size of a momentum move (rolling volatility * sqrt(window))
+# -> a volatile pair (e.g. USD/ZAR) needs a bigger move than EUR/USD to trigger a trade
+def threshold_series(values, threshold, window, vol_scale, volatility):
+    if vol_scale is None:
+        return np.full(len(values), threshold)
+    return vol_scale * np.sqrt(window) * np.asarray(volatility)
+
+# MM1 Strategy -> parametrized by the momentum time window (threshold defaults to the value for the selected time period, vol_scale switches to a volatility-scaled threshold)
+class MMStrategy1(Strategy):
+    window = 10
+    threshold = None
+    vol_scale = None
+    vol_window = 20
+    timeframe = "1y"
+
+    def init(self):
+        if self.threshold is None:
+            self.threshold = get_threshold(self.timeframe)
+        self.momentum_indicator = self.I(momentum, self.data.Close, self.window)
+        volatility = None
+        if self.vol_scale is not None:
+            volatility = getattr(self.data, "Volatility", None) # Precomputed by optimize_mm_strategy
+            if volatility is None:
+                volatility = rolling_volatility(self.data.Close, self.vol_window)
+        self.threshold_indicator = self.I(threshold_series, self.data.Close, self.threshold, self.window, self.vol_scale, volatility, plot=False)
+
+    def next(self):
+        m, t = self.momentum_indicator, self.threshold_indicator
+        if np.isnan(m[-2]) or np.isnan(m[-1]) or np.isnan(t[-2]) or np.isnan(t[-1]):  # avoid NaNs
+            return
+
+        # Sequential logic: close existing position first before entering reverse trade (to avoid mis-judging momentum shifts)
+        if self.position.is_long and m[-2] >= t[-2] and m[-1] < t[-1]:
+            self.position.close()  # Close long if momentum crosses below threshold
+        elif self.position.is_short and m[-2] <= -t[-2] and m[-1] > -t[-1]:
+            self.position.close()  # Close short if momentum crosses above -threshold
+
+        elif not self.position:
+            if m[-2] < t[-2] and m[-1] >= t[-1]:
+                self.buy()  # Enter long if momentum crosses above threshold
+            elif m[-2] > -t[-2] and m[-1] <= -t[-1]:
+                self.sell()  # Enter short if momentum crosses below -threshold
+
+# Backtesting one (window, vol_scale) candidate of the MM1 grid
+def evaluate_mm_strategy(data, window, vol_scale, time):
+    bt = Backtest(data, MMStrategy1, cash=10000, commission=0.0002)
+    stats = bt.run(window=window, vol_scale=vol_scale, timeframe=time)
+    net_return = (stats["Equity Final [$]"] - 10000) / 10000
+    return window, vol_scale, net_return
+
+def optimize_mm_strategy(df, time):
+    # Volatility is computed once here -> every (window, vol_scale) candidate's threshold is just a scalar multiple of it
+    data = df.assign(Volatility=rolling_volatility(df["Close"].to_numpy(), MMStrategy1.vol_window))
+
+    # MM1 -> Finding the optimal time window & volatility scaling for momentum-based Strategy that results in the highest net return
+    # --- Run parallel jobs over the whole grid ---
+    results = Parallel(n_jobs=-1, backend='loky')(
+        delayed(evaluate_mm_strategy)(data, window, vol_scale, time)
+        for window, vol_scale in itertools.product(range(3, 20), vol_scales)
+    )
+
+    # --- Select best parameters ---
+    best_window, best_scale, net_return = max(results, key=lambda x: x[2])
+    best_params = {"window": best_window, "vol_scale": best_scale}
+
+    # Optimal window MMStrategy -> to be passed into main module together with the parameters to run it with
+    return MMStrategy1, best_params, net_return
+
+# MM2 Strategy -> momentum signal filtered by an SMA trend line
+class CombinedStrategy1(Strategy):
+    momentum_window = 10
+    sma_window = 30
+    momentum_threshold = 0.01
+    timeframe = "1y"
+
+    def init(self):
+        self.mm_indicator = self.I(momentum, self.data.Close, self.momentum_window)
+        self.sma_indicator = self.I(SMA, self.data.Close, self.sma_window)
+
+    def next(self):
+        if np.isnan(self.mm_indicator[-2]) or np.isnan(self.mm_indicator[-1]) or np.isnan(self.sma_indicator[-1]):
+            return
+        elif self.position.is_long and self.mm_indicator[-2] >= self.momentum_threshold and self.mm_indicator[-1] < self.momentum_threshold:
+            self.position.close()
+        elif self.position.is_short and self.mm_indicator[-2] <= -self.momentum_threshold and self.mm_indicator[-1] > -self.momentum_threshold:
+            self.position.close()
+        elif not self.position:
+            if (self.mm_indicator[-2] < self.momentum_threshold and self.mm_indicator[-1] >= self.momentum_threshold) and self.data.Close > self.sma_indicator[-1]:
+                self.buy()
+            elif (self.mm_indicator[-2] > -self.momentum_threshold and self.mm_indicator[-1] <= -self.momentum_threshold) and self.data.Close > self.sma_indicator[-1]:
+                self.sell()
+
+# Strategy classes are defined at module level -> joblib workers pickle them by reference instead of by closure
+def evaluate_combined_strategy(df, momentum_window, sma_window, momentum_threshold):
+    bt = Backtest(df, CombinedStrategy1, cash=10000, commission=0.0002)
+    stats = bt.run(momentum_window=momentum_window, sma_window=sma_window, momentum_threshold=momentum_threshold)
+    net_return = (stats["Equity Final [$]"] - 10000) / 10000
+    return momentum_window, sma_window, momentum_threshold, net_return
+
+def combined_optimal_strategy(df, time):
+    # --- Define parameter space ---
+    momentum_windows = range(5, 21)
+    sma_windows = range(6, 50)
+    thresholds = np.arange(0.005, 0.03, 0.0025)
+
+    param_grid = [
+        (m, s, t)
+        for m in momentum_windows
+        for s in sma_windows if s > m
+        for t in thresholds
+    ]
+
+    # --- Run parallel jobs ---
+    results = Parallel(n_jobs=-1, backend='loky')(
+        delayed(evaluate_combined_strategy)(df, m, s, t)
+        for (m, s, t) in param_grid
+    )
+
+    # --- Select best parameters ---
+    best_m, best_s, best_t, best_ret = max(results, key=lambda x: x[3])
+    best_params = {"momentum_window": best_m, "sma_window": best_s, "momentum_threshold": float(best_t)}
+
+    return CombinedStrategy1, best_params, best_ret
+
+###########################################################################################################################################
+
+# MM3 Strategy -> momentum signal filtered by an EMA trend line
+class CombinedStrategy2(Strategy):
+    momentum_window = 10
+    ema_window = 30
+    momentum_threshold = 0.01
+    timeframe = "1y"
+
+    def init(self):
+        self.mm_indicator = self.I(momentum, self.data.Close, self.momentum_window)
+        self.ema_indicator = self.I(EMA, self.data.Close, self.ema_window)
+
+    def next(self):
+        if np.isnan(self.mm_indicator[-2]) or np.isnan(self.mm_indicator[-1]) or np.isnan(self.ema_indicator[-1]):
+            return
+        elif self.position.is_long and self.mm_indicator[-2] >= self.momentum_threshold and self.mm_indicator[-1] < self.momentum_threshold:
+            self.position.close()
+        elif self.position.is_short and self.mm_indicator[-2] <= -self.momentum_threshold and self.mm_indicator[-1] > -self.momentum_threshold:
+            self.position.close()
+        elif not self.position:
+            if (self.mm_indicator[-2] < self.momentum_threshold and self.mm_indicator[-1] >= self.momentum_threshold) and self.data.Close > self.ema_indicator[-1]:
+                self.buy()
+            elif (self.mm_indicator[-2] > -self.momentum_threshold and self.mm_indicator[-1] <= -self.momentum_threshold) and self.data.Close > self.ema_indicator[-1]:
+                self.sell()
+
+def evaluate_combined_strategy1(df, momentum_window, ema_window, momentum_threshold):
+    bt = Backtest(df, CombinedStrategy2, cash=10000, commission=0.0002)
+    stats = bt.run(momentum_window=momentum_window, ema_window=ema_window, momentum_threshold=momentum_threshold)
+    net_return = (stats["Equity Final [$]"] - 10000) / 10000
+    return momentum_window, ema_window, momentum_threshold, net_return
+
+def combined_optimal_strategy1(df, time):
+    # --- Define parameter space ---
+    momentum_windows = range(5, 21)
+    ema_windows = range(6, 50)
+    thresholds = np.arange(0.005, 0.03, 0.0025)
+
+    param_grid = [
+        (m, e, t)
+        for m in momentum_windows
+        for e in ema_windows if e > m
+        for t in thresholds
+    ]
+
+    # --- Run parallel jobs ---
+    results = Parallel(n_jobs=-1, backend='loky')(
+        delayed(evaluate_combined_strategy1)(df, m, e, t)
+        for (m, e, t) in param_grid
+    )
+
+    # --- Select best parameters ---
+    best_m, best_e, best_t, best_ret = max(results, key=lambda x: x[3])
+    best_params = {"momentum_window": best_m, "ema_window": best_e, "momentum_threshold": float(best_t)}
+
+    return CombinedStrategy2, best_params, best_ret
@@ -0,0 +1,37 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from ingest import FixtureSource, ingestion_jobs, main
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "ingest")
+
+
+def test_ingest_all_from_fixtures(tmp_path):
+    main(source=FixtureSource(FIXTURES), data_dir=str(tmp_path), backoff=0)
+
+    assert sorted(os.listdir(tmp_path)) == sorted(job[4] for job in ingestion_jobs())
+    intraday = pd.read_csv(tmp_path / "eurusd_5dm")
+    assert list(intraday.columns)[:6] == ["Date", "Open", "High", "Low", "Close", "Volume"]
+    assert not any(c.startswith("Unnamed:") for c in intraday.columns)
+    assert "Datetime" not in intraday.columns
+
+
+def test_missing_and_empty_sources_are_reported(tmp_path, capsys):
+    fixtures = tmp_path / "fixtures"
+    shutil.copytree(FIXTURES, fixtures)
+    os.remove(fixtures / "USDJPY=X_1d_1y.csv")  # missing -> not retried
+    with open(fixtures / "GBPUSD=X_1d_6mo.csv") as f:
+        header = f.readline()
+    with open(fixtures / "GBPUSD=X_1d_6mo.csv", "w") as f:
+        f.write(header)  # empty frame -> retried, then reported
+
+    with pytest.raises(RuntimeError, match="2 of 15 downloads failed"):
+        main(source=FixtureSource(str(fixtures)), data_dir=str(tmp_path / "data"), retries=2, backoff=0)
+
+    out = capsys.readouterr().out
+    assert "Retrying GBPUSD=X" in out
+    assert "Retrying USDJPY=X" not in out
+    assert len(os.listdir(tmp_path / "data")) == 13